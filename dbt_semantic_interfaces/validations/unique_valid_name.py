@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 import enum
+import functools
+import itertools
 import re
-from typing import Dict, Generic, List, Optional, Sequence, Tuple, Union
+import string
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.protocols import (
+    Dimension,
+    Entity,
+    Measure,
     Metric,
     SavedQuery,
     SemanticManifest,
     SemanticManifestT,
     SemanticModel,
 )
-from dbt_semantic_interfaces.references import (
-    ElementReference,
-    SemanticModelElementReference,
-)
+from dbt_semantic_interfaces.references import SemanticModelElementReference
 from dbt_semantic_interfaces.type_enums import (
     EntityType,
     SemanticManifestNodeType,
@@ -55,6 +69,61 @@ class MetricFlowReservedKeywords(enum.Enum):
             assert_values_exhausted(keyword)
 
 
+# Computed once at import time as these are checked for every name in the manifest.
+_RESERVED_KEYWORD_REASONS: Dict[str, str] = {
+    keyword.value: MetricFlowReservedKeywords.get_reserved_reason(keyword) for keyword in MetricFlowReservedKeywords
+}
+_TIME_GRANULARITY_NAMES = frozenset(TimeGranularity.list_names())
+_LOWER_TIME_GRANULARITY_NAMES = frozenset(name.lower() for name in _TIME_GRANULARITY_NAMES)
+_TIME_GRANULARITY_NAMES_STR = str(TimeGranularity.list_names())
+
+_NAME_START_CHARS = frozenset(string.ascii_lowercase)
+_NAME_END_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "_")
+
+
+def _is_valid_name(name: str) -> bool:
+    """Equivalent to `UniqueAndValidNameRule.NAME_REGEX.match(name)`, without the overhead of the regex engine."""
+    return (
+        len(name) >= 2
+        and name[0] in _NAME_START_CHARS
+        and name[-1] in _NAME_END_CHARS
+        and "__" not in name
+        and _NAME_CHARS.issuperset(name)
+    )
+
+
+class _InvalidNameReason(enum.Enum):
+    """The ways in which a name can fail validation."""
+
+    INVALID_FORMAT = "invalid_format"
+    TIME_GRANULARITY_KEYWORD = "time_granularity_keyword"
+    RESERVED_KEYWORD = "reserved_keyword"
+
+
+@functools.lru_cache(maxsize=4096)
+def _invalid_name_reasons(name: str) -> Tuple[_InvalidNameReason, ...]:
+    """Returns why the name is invalid, or an empty tuple if it's valid.
+
+    This is cached since the same names (e.g. `ds` or `user`) tend to show up many times in a manifest.
+    """
+    reasons: List[_InvalidNameReason] = []
+    if _is_valid_name(name):
+        # Valid names are already lower case, so the keyword checks don't need a case-converted copy of the name.
+        is_time_granularity_keyword = name in _LOWER_TIME_GRANULARITY_NAMES
+        is_reserved_keyword = name in _RESERVED_KEYWORD_REASONS
+    else:
+        reasons.append(_InvalidNameReason.INVALID_FORMAT)
+        is_time_granularity_keyword = name.upper() in _TIME_GRANULARITY_NAMES
+        is_reserved_keyword = name.lower() in _RESERVED_KEYWORD_REASONS
+
+    if is_time_granularity_keyword:
+        reasons.append(_InvalidNameReason.TIME_GRANULARITY_KEYWORD)
+    if is_reserved_keyword:
+        reasons.append(_InvalidNameReason.RESERVED_KEYWORD)
+    return tuple(reasons)
+
+
 class UniqueAndValidNameRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Check that names are unique and valid.
 
@@ -66,175 +135,158 @@ class UniqueAndValidNameRule(SemanticManifestValidationRule[SemanticManifestT],
     # name must end with a number or lower case letter
     # name may include lower case letters, numbers, and underscores
     # name may not contain dunders (two sequential underscores
+    # This is checked by `_is_valid_name`, which must stay in sync with this pattern.
     NAME_REGEX = re.compile(r"\A[a-z]((?!__)[a-z0-9_])*[a-z0-9]\Z")
 
     @staticmethod
-    def check_valid_name(name: str, context: Optional[ValidationContext] = None) -> List[ValidationIssue]:  # noqa: D
-        issues: List[ValidationIssue] = []
+    def check_valid_name(  # noqa: D
+        name: str, context: Optional[ValidationContext] = None
+    ) -> Sequence[ValidationIssue]:
+        return UniqueAndValidNameRule._check_valid_name(name=name, context_factory=lambda: context)
 
-        if not UniqueAndValidNameRule.NAME_REGEX.match(name):
-            issues.append(
-                ValidationError(
-                    context=context,
-                    message=f"Invalid name `{name}` - names may only contain lower case letters, numbers, "
+    @staticmethod
+    def _check_valid_name(
+        name: str, context_factory: Callable[[], Optional[ValidationContext]]
+    ) -> Sequence[ValidationIssue]:
+        """Same as check_valid_name, but the context is only built when the name has issues."""
+        reasons = _invalid_name_reasons(name)
+        if not reasons:
+            return ()
+
+        context = context_factory()
+        issues: List[ValidationIssue] = []
+        for reason in reasons:
+            if reason is _InvalidNameReason.INVALID_FORMAT:
+                message = (
+                    f"Invalid name `{name}` - names may only contain lower case letters, numbers, "
                     f"and underscores. Additionally, names must start with a lower case letter, cannot end "
                     f"with an underscore, cannot contain dunders (double underscores, or __), and must be "
-                    f"at least 2 characters long.",
+                    f"at least 2 characters long."
                 )
-            )
-        if name.upper() in TimeGranularity.list_names():
-            issues.append(
-                ValidationError(
-                    context=context,
-                    message=f"Invalid name `{name}` - names cannot match reserved time granularity keywords "
-                    f"({TimeGranularity.list_names()})",
+            elif reason is _InvalidNameReason.TIME_GRANULARITY_KEYWORD:
+                message = (
+                    f"Invalid name `{name}` - names cannot match reserved time granularity keywords "
+                    f"({_TIME_GRANULARITY_NAMES_STR})"
                 )
-            )
-        if name.lower() in {reserved_name.value for reserved_name in MetricFlowReservedKeywords}:
-            reason = MetricFlowReservedKeywords.get_reserved_reason(MetricFlowReservedKeywords(name.lower()))
-            issues.append(
-                ValidationError(
-                    context=context,
-                    message=f"Invalid name `{name}` - this name is reserved by MetricFlow. Reason: {reason}",
+            elif reason is _InvalidNameReason.RESERVED_KEYWORD:
+                message = (
+                    f"Invalid name `{name}` - this name is reserved by MetricFlow. "
+                    f"Reason: {_RESERVED_KEYWORD_REASONS[name.lower()]}"
                 )
-            )
+            else:
+                assert_values_exhausted(reason)
+            issues.append(ValidationError(context=context, message=message))
         return issues
 
     @staticmethod
     @validate_safely(whats_being_done="checking semantic model sub element names are unique")
-    def _validate_semantic_model_elements(semantic_model: SemanticModel) -> List[ValidationIssue]:
-        issues: List[ValidationIssue] = []
-        element_info_tuples: List[Tuple[ElementReference, str, ValidationContext]] = []
-
-        if semantic_model.measures:
-            for measure in semantic_model.measures:
-                element_info_tuples.append(
-                    (
-                        measure.reference,
-                        "measure",
-                        SemanticModelElementContext(
-                            file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
-                            semantic_model_element=SemanticModelElementReference(
-                                semantic_model_name=semantic_model.name, element_name=measure.name
-                            ),
-                            element_type=SemanticModelElementType.MEASURE,
-                        ),
-                    )
-                )
-        if semantic_model.entities:
-            for entity in semantic_model.entities:
-                element_info_tuples.append(
-                    (
-                        entity.reference,
-                        "entity",
-                        SemanticModelElementContext(
-                            file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
-                            semantic_model_element=SemanticModelElementReference(
-                                semantic_model_name=semantic_model.name, element_name=entity.name
-                            ),
-                            element_type=SemanticModelElementType.ENTITY,
-                        ),
-                    )
-                )
-        if semantic_model.dimensions:
-            for dimension in semantic_model.dimensions:
-                element_info_tuples.append(
-                    (
-                        dimension.reference,
-                        "dimension",
-                        SemanticModelElementContext(
-                            file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
-                            semantic_model_element=SemanticModelElementReference(
-                                semantic_model_name=semantic_model.name, element_name=dimension.name
-                            ),
-                            element_type=SemanticModelElementType.DIMENSION,
-                        ),
-                    )
-                )
-        name_to_type: Dict[ElementReference, str] = {}
-
-        for name, _type, context in element_info_tuples:
-            if name in name_to_type:
-                issues.append(
-                    ValidationError(
-                        context=context,
-                        message=f"In semantic model `{semantic_model.name}`, can't use name `{name.element_name}` for "
-                        f"a {_type} when it was already used for a {name_to_type[name]}",
-                    )
-                )
-            else:
-                name_to_type[name] = _type
+    def _validate_semantic_model_elements(semantic_model: SemanticModel) -> Sequence[ValidationIssue]:
+        return list(UniqueAndValidNameRule._iter_semantic_model_element_issues(semantic_model))
 
-        for name, _, context in element_info_tuples:
-            issues += UniqueAndValidNameRule.check_valid_name(name=name.element_name, context=context)
+    @staticmethod
+    def _iter_semantic_model_element_issues(semantic_model: SemanticModel) -> Iterator[ValidationIssue]:
+        file_context = FileContext.from_metadata(metadata=semantic_model.metadata)
+
+        def make_context(element_name: str, element_type: SemanticModelElementType) -> SemanticModelElementContext:
+            return SemanticModelElementContext(
+                file_context=file_context,
+                semantic_model_element=SemanticModelElementReference(
+                    semantic_model_name=semantic_model.name, element_name=element_name
+                ),
+                element_type=element_type,
+            )
 
-        return issues
+        # Duplicates are tracked per element type. Keying on plain strings avoids building and hashing a reference
+        # object for every element.
+        seen_elements: Set[Tuple[str, str]] = set()
+        elements_of_type: Tuple[Tuple[Sequence[Union[Measure, Entity, Dimension]], SemanticModelElementType], ...] = (
+            (semantic_model.measures or (), SemanticModelElementType.MEASURE),
+            (semantic_model.entities or (), SemanticModelElementType.ENTITY),
+            (semantic_model.dimensions or (), SemanticModelElementType.DIMENSION),
+        )
+        for elements, element_type in elements_of_type:
+            for element in elements:
+                element_key = (element_type.value, element.name)
+                if element_key in seen_elements:
+                    yield ValidationError(
+                        context=make_context(element.name, element_type),
+                        message=f"In semantic model `{semantic_model.name}`, can't use name `{element.name}` for "
+                        f"a {element_type.value} when it was already used for a {element_type.value}",
+                    )
+                else:
+                    seen_elements.add(element_key)
+
+                yield from UniqueAndValidNameRule._check_valid_name(
+                    name=element.name,
+                    context_factory=functools.partial(make_context, element.name, element_type),
+                )
 
     @staticmethod
     @validate_safely(whats_being_done="checking top level elements of a specific type have unique and valid names")
     def _validate_top_level_objects_of_type(
         objects: Union[List[SemanticModel], List[Metric], List[SavedQuery]],
         object_type: SemanticManifestNodeType,
-    ) -> List[ValidationIssue]:
+    ) -> Sequence[ValidationIssue]:
         """Validates uniqeness and validaty of top level objects of singular type."""
-        issues: List[ValidationIssue] = []
+        return list(UniqueAndValidNameRule._iter_top_level_object_of_type_issues(objects, object_type))
+
+    @staticmethod
+    def _iter_top_level_object_of_type_issues(
+        objects: Union[List[SemanticModel], List[Metric], List[SavedQuery]],
+        object_type: SemanticManifestNodeType,
+    ) -> Iterator[ValidationIssue]:
         object_names = set()
 
-        for object in objects:
-            context = ValidationIssueContext(
+        def make_context(object: Union[SemanticModel, Metric, SavedQuery]) -> ValidationIssueContext:
+            return ValidationIssueContext(
                 file_context=FileContext.from_metadata(object.metadata),
                 object_name=object.name,
                 object_type=object_type.value,
             )
-            issues += UniqueAndValidNameRule.check_valid_name(name=object.name, context=context)
+
+        for object in objects:
+            yield from UniqueAndValidNameRule._check_valid_name(
+                name=object.name, context_factory=functools.partial(make_context, object)
+            )
             if object.name in object_names:
-                issues.append(
-                    ValidationError(
-                        context=context,
-                        message=f"Can't use name `{object.name}` for a {object_type} when it was already "
-                        f"used for another {object_type}",
-                    )
+                yield ValidationError(
+                    context=make_context(object),
+                    message=f"Can't use name `{object.name}` for a {object_type} when it was already "
+                    f"used for another {object_type}",
                 )
             else:
                 object_names.add(object.name)
-        return issues
 
     @staticmethod
     @validate_safely(whats_being_done="checking model top level element names are sufficiently unique")
-    def _validate_top_level_objects(semantic_manifest: SemanticManifest) -> List[ValidationIssue]:
+    def _validate_top_level_objects(semantic_manifest: SemanticManifest) -> Sequence[ValidationIssue]:
         """Checks names of objects that are not nested."""
-        issues: List[ValidationIssue] = []
+        return list(UniqueAndValidNameRule._iter_top_level_object_issues(semantic_manifest))
 
-        issues.extend(
-            UniqueAndValidNameRule._validate_top_level_objects_of_type(
-                semantic_manifest.semantic_models, SemanticManifestNodeType.SEMANTIC_MODEL
-            )
+    @staticmethod
+    def _iter_top_level_object_issues(semantic_manifest: SemanticManifest) -> Iterator[ValidationIssue]:
+        yield from UniqueAndValidNameRule._validate_top_level_objects_of_type(
+            semantic_manifest.semantic_models, SemanticManifestNodeType.SEMANTIC_MODEL
         )
-
-        issues.extend(
-            UniqueAndValidNameRule._validate_top_level_objects_of_type(
-                semantic_manifest.metrics, SemanticManifestNodeType.METRIC
-            )
+        yield from UniqueAndValidNameRule._validate_top_level_objects_of_type(
+            semantic_manifest.metrics, SemanticManifestNodeType.METRIC
         )
-
-        issues.extend(
-            UniqueAndValidNameRule._validate_top_level_objects_of_type(
-                semantic_manifest.saved_queries, SemanticManifestNodeType.SAVED_QUERY
-            )
+        yield from UniqueAndValidNameRule._validate_top_level_objects_of_type(
+            semantic_manifest.saved_queries, SemanticManifestNodeType.SAVED_QUERY
         )
 
-        return issues
-
     @staticmethod
     @validate_safely(whats_being_done="running model validation ensuring elements have adequately unique names")
     def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D
-        issues = []
-        issues += UniqueAndValidNameRule._validate_top_level_objects(semantic_manifest=semantic_manifest)
-
-        for semantic_model in semantic_manifest.semantic_models:
-            issues += UniqueAndValidNameRule._validate_semantic_model_elements(semantic_model=semantic_model)
-
-        return issues
+        return list(
+            itertools.chain(
+                UniqueAndValidNameRule._validate_top_level_objects(semantic_manifest=semantic_manifest),
+                itertools.chain.from_iterable(
+                    UniqueAndValidNameRule._validate_semantic_model_elements(semantic_model=semantic_model)
+                    for semantic_model in semantic_manifest.semantic_models
+                ),
+            )
+        )
 
 
 class PrimaryEntityDimensionPairs(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
@@ -245,58 +297,65 @@ class PrimaryEntityDimensionPairs(SemanticManifestValidationRule[SemanticManifes
         whats_being_done="validating the semantic model doesn't have dimension + primary entity pair conflicts"
     )
     def _check_semantic_model(  # noqa: D
-        semantic_model: SemanticModel, known_pairings: Dict[str, Dict[str, str]]
+        semantic_model: SemanticModel, known_pairings: Dict[Tuple[str, str], str]
     ) -> Sequence[ValidationIssue]:
-        issues: List[ValidationIssue] = []
+        return list(
+            PrimaryEntityDimensionPairs._iter_semantic_model_issues(
+                semantic_model=semantic_model, known_pairings=known_pairings
+            )
+        )
 
+    @staticmethod
+    def _iter_semantic_model_issues(
+        semantic_model: SemanticModel, known_pairings: Dict[Tuple[str, str], str]
+    ) -> Iterator[ValidationIssue]:
         primary_entity = semantic_model.primary_entity
         if primary_entity is None:
-            for entity in semantic_model.entities:
-                if entity.type is EntityType.PRIMARY:
-                    primary_entity = entity.name
-                    break
+            primary_entity = next(
+                (entity.name for entity in semantic_model.entities if entity.type is EntityType.PRIMARY), None
+            )
 
         # If primary entity is still none, return early. It's an issue,
         # but not the subject of this validation. This is handled by
         # PrimaryEntityRule
         if primary_entity is None:
-            return issues
-
-        safe = False
-        if known_pairings.get(primary_entity) is None:
-            known_pairings[primary_entity] = {}
-            safe = True
+            return
 
+        dimension_names_in_semantic_model: Set[str] = set()
         for dimension in semantic_model.dimensions:
-            if safe or known_pairings[primary_entity].get(dimension.name) is None:
-                known_pairings[primary_entity][dimension.name] = semantic_model.name
+            # A dimension repeated within one semantic model is reported by UniqueAndValidNameRule.
+            if dimension.name in dimension_names_in_semantic_model:
+                continue
+            dimension_names_in_semantic_model.add(dimension.name)
+
+            pairing = (primary_entity, dimension.name)
+            semantic_model_with_pairing = known_pairings.get(pairing)
+            if semantic_model_with_pairing is None:
+                known_pairings[pairing] = semantic_model.name
             else:
-                issues.append(
-                    ValidationError(
-                        context=SemanticModelElementContext(
-                            file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
-                            semantic_model_element=SemanticModelElementReference(
-                                semantic_model_name=semantic_model.name, element_name=dimension.name
-                            ),
-                            element_type=SemanticModelElementType.DIMENSION,
+                yield ValidationError(
+                    context=SemanticModelElementContext(
+                        file_context=FileContext.from_metadata(metadata=semantic_model.metadata),
+                        semantic_model_element=SemanticModelElementReference(
+                            semantic_model_name=semantic_model.name, element_name=dimension.name
                         ),
-                        message="Duplicate dimension + primary entity pairing detected, dimension + primary entity "
-                        f"pairings must be unique. Semantic model `{semantic_model.name}` has a primary entity of "
-                        f"`{primary_entity}` and dimension `{dimension.name}`, but this pairing is already in use on "
-                        f"semantic model `{known_pairings[primary_entity][dimension.name]}`.",
-                    )
+                        element_type=SemanticModelElementType.DIMENSION,
+                    ),
+                    message="Duplicate dimension + primary entity pairing detected, dimension + primary entity "
+                    f"pairings must be unique. Semantic model `{semantic_model.name}` has a primary entity of "
+                    f"`{primary_entity}` and dimension `{dimension.name}`, but this pairing is already in use on "
+                    f"semantic model `{semantic_model_with_pairing}`.",
                 )
 
-        return issues
-
     @staticmethod
     @validate_safely(whats_being_done="validating there are no duplicate dimension primary entity pairs")
     def validate_manifest(semantic_manifest: SemanticManifestT) -> Sequence[ValidationIssue]:  # noqa: D
-        issues = []
-        known_pairings: Dict[str, Dict[str, str]] = {}
-        for semantic_model in semantic_manifest.semantic_models:
-            issues += PrimaryEntityDimensionPairs._check_semantic_model(
-                semantic_model=semantic_model, known_pairings=known_pairings
+        known_pairings: Dict[Tuple[str, str], str] = {}
+        return list(
+            itertools.chain.from_iterable(
+                PrimaryEntityDimensionPairs._check_semantic_model(
+                    semantic_model=semantic_model, known_pairings=known_pairings
+                )
+                for semantic_model in semantic_manifest.semantic_models
             )
-
-        return issues
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import inspect
 import traceback
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -389,7 +390,11 @@ def _func_args_to_string(*args: Any, **kwargs: Any) -> str:  # type: ignore
 
 
 def validate_safely(whats_being_done: str) -> Callable:
-    """Decorator to safely run validation checks."""
+    """Decorator to safely run validation checks.
+
+    If the check is a generator function, its issues are collected into a list so that exceptions raised while
+    iterating are also handled.
+    """
 
     def decorator_check_element_safely(func: Callable) -> Callable:  # noqa
         @functools.wraps(func)
@@ -398,6 +403,9 @@ def validate_safely(whats_being_done: str) -> Callable:
             issues: List[ValidationIssue]
             try:
                 issues = func(*args, **kwargs)
+                # A generator only runs as it's iterated, so collect its issues here to handle any exceptions.
+                if inspect.isgenerator(issues):
+                    issues = list(issues)
             except Exception as e:
                 arguments_str = _func_args_to_string(*args, **kwargs)
                 issues = [
@@ -2,6 +2,8 @@ from copy import deepcopy
 
 import more_itertools
 import pytest
+from hypothesis import given
+from hypothesis.strategies import text
 
 from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
@@ -15,6 +17,7 @@ from dbt_semantic_interfaces.validations.unique_valid_name import (
     MetricFlowReservedKeywords,
     PrimaryEntityDimensionPairs,
     UniqueAndValidNameRule,
+    _is_valid_name,
 )
 from dbt_semantic_interfaces.validations.validator_helpers import (
     SemanticManifestValidationException,
@@ -266,37 +269,79 @@ def test_primary_entity_dimension_pairs_with_issues(  # noqa: D
     assert results.has_blocking_issues
 
 
+def test_primary_entity_dimension_pairs_with_duplicate_dimension_in_semantic_model(  # noqa: D
+    simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest,
+) -> None:
+    manifest = deepcopy(simple_semantic_manifest__with_primary_transforms)
+    semantic_model_with_dimensions, _ = find_semantic_model_with(
+        manifest, lambda semantic_model: len(semantic_model.dimensions) > 0
+    )
+    duplicated_dimension = semantic_model_with_dimensions.dimensions[0]
+    semantic_model_with_dimensions.dimensions = tuple(semantic_model_with_dimensions.dimensions) + (
+        duplicated_dimension,
+    )
+
+    # The duplicate dimension is reported by UniqueAndValidNameRule, not as a conflicting pairing.
+    validator = SemanticManifestValidator[PydanticSemanticManifest]([PrimaryEntityDimensionPairs()])
+    results = validator.validate_semantic_manifest(manifest)
+    assert not results.has_blocking_issues
+
+
+def test_primary_entity_dimension_pairs_with_same_named_semantic_models(  # noqa: D
+    simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest,
+) -> None:
+    manifest = deepcopy(simple_semantic_manifest__with_primary_transforms)
+    semantic_model_with_dimensions, _ = find_semantic_model_with(
+        manifest, lambda semantic_model: len(semantic_model.dimensions) > 0
+    )
+    # e.g. the same semantic model defined in two YAML files
+    manifest.semantic_models.append(deepcopy(semantic_model_with_dimensions))
+
+    with pytest.raises(
+        SemanticManifestValidationException,
+        match=rf"but this pairing is already in use on semantic model `{semantic_model_with_dimensions.name}`",
+    ):
+        SemanticManifestValidator[PydanticSemanticManifest]([PrimaryEntityDimensionPairs()]).checked_validations(
+            manifest
+        )
+
+
 """
     Tests for valid naming
 """
 
 
 def test_name_is_valid() -> None:  # noqa:D
-    assert UniqueAndValidNameRule.check_valid_name("this_is_valid1") == []
+    assert len(UniqueAndValidNameRule.check_valid_name("this_is_valid1")) == 0
 
 
 def test_invalid_names() -> None:  # noqa:D
     # This is non-exhaustive, but covers some "common" error cases
-    assert UniqueAndValidNameRule.check_valid_name("this is invalid") != []
-    assert UniqueAndValidNameRule.check_valid_name("100%invalid") != []
-    assert UniqueAndValidNameRule.check_valid_name("no-hyphens-allowed") != []
-    assert UniqueAndValidNameRule.check_valid_name("punctuation.is.bad") != []
-    assert UniqueAndValidNameRule.check_valid_name("cantwildstarme*") != []
-    assert UniqueAndValidNameRule.check_valid_name("noemails@hellowdotcom") != []
-    assert UniqueAndValidNameRule.check_valid_name("(no)(ordering)(operations)") != []
-    assert UniqueAndValidNameRule.check_valid_name("path/to/invalid/name") != []
-    assert UniqueAndValidNameRule.check_valid_name("#notwitterhere") != []
-    assert UniqueAndValidNameRule.check_valid_name("_no_leading_underscore") != []
-    assert UniqueAndValidNameRule.check_valid_name("no_trailing_underscore_") != []
-    assert UniqueAndValidNameRule.check_valid_name("_definitely_no_leading_and_trailing_underscore_") != []
-    assert UniqueAndValidNameRule.check_valid_name("name__with__dunders") != []
+    assert len(UniqueAndValidNameRule.check_valid_name("this is invalid")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("100%invalid")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("no-hyphens-allowed")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("punctuation.is.bad")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("cantwildstarme*")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("noemails@hellowdotcom")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("(no)(ordering)(operations)")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("path/to/invalid/name")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("#notwitterhere")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("_no_leading_underscore")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("no_trailing_underscore_")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("_definitely_no_leading_and_trailing_underscore_")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("name__with__dunders")) > 0
 
     # time granularity values are reserved
-    assert UniqueAndValidNameRule.check_valid_name("day") != []
-    assert UniqueAndValidNameRule.check_valid_name("week") != []
-    assert UniqueAndValidNameRule.check_valid_name("month") != []
-    assert UniqueAndValidNameRule.check_valid_name("quarter") != []
-    assert UniqueAndValidNameRule.check_valid_name("year") != []
+    assert len(UniqueAndValidNameRule.check_valid_name("day")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("week")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("month")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("quarter")) > 0
+    assert len(UniqueAndValidNameRule.check_valid_name("year")) > 0
+
+
+@given(text(alphabet="ab1_-A ", max_size=8))
+def test_is_valid_name_matches_name_regex(name: str) -> None:  # noqa: D
+    assert _is_valid_name(name) == bool(UniqueAndValidNameRule.NAME_REGEX.match(name))
 
 
 def test_reserved_name() -> None:  # noqa: D
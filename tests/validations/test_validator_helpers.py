@@ -1,5 +1,5 @@
 from datetime import date
-from typing import List
+from typing import Iterator, List
 
 import pytest
 
@@ -148,3 +148,15 @@ def test_validate_safely_handles_exceptions():  # noqa: D
     # We shouldn't get an unhandled exception from this
     validation_issues = checking_validate_safely()
     assert len(validation_issues) == 1
+
+
+def test_validate_safely_handles_exceptions_in_generators():  # noqa: D
+    @validate_safely("testing validate safely handles exceptions raised by generators")
+    def checking_validate_safely() -> Iterator[ValidationIssue]:
+        yield ValidationWarning(context=FileContext(file_name="foo", line_number=1337), message="A warning")
+        raise (Exception("Oh no an exception!"))
+
+    # We shouldn't get an unhandled exception from this, and issues yielded before the exception are dropped
+    validation_issues = checking_validate_safely()
+    assert len(validation_issues) == 1
+    assert "Oh no an exception!" in validation_issues[0].message